@@ -10,18 +10,24 @@ Data sources:
 
 Usage:
     pip install -r requirements.txt
-    python scripts/scrape.py
+    python scripts/scrape.py [--head-preflight]
 """
 
-import io
-import json
+import argparse
+import asyncio
 import re
+import secrets
 import sys
-import time
 import unicodedata
 import zipfile
+import httpx
+import orjson
 import requests
+from collections import Counter
+from lxml import etree, html as lxml_html
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # ---------------------------------------------------------------------------
 # Configuration
@@ -30,12 +36,17 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 DATA_DIR = BASE_DIR / "data"
 PHOTOS_DIR = BASE_DIR / "photos"
 
+# Photo URL -> {etag, last_modified, path}, for conditional GETs on re-scrapes.
+# Local to each checkout (git-ignored), since it describes that copy's fetches.
+PHOTO_ETAGS_FILE = PHOTOS_DIR / ".etags.json"
+
 # AN open data – current legislature deputies + organes
 AN_OPENDATA_ZIP = (
     "https://data.assemblee-nationale.fr/static/openData/repository/17/"
     "amo/deputes_actifs_mandats_actifs_organes/"
     "AMO10_deputes_actifs_mandats_actifs_organes.json.zip"
 )
+AN_OPENDATA_CACHE = DATA_DIR / ".cache" / "AMO10.zip"
 
 # AN official photos – best available (240×240 square)
 AN_PHOTO_URL = "https://www.assemblee-nationale.fr/dyn/static/tribun/17/photos/carre/{pa_id}.jpg"
@@ -48,6 +59,13 @@ SESSION = requests.Session()
 SESSION.headers.update({
     "User-Agent": "Polidle/1.0 (Educational game about French politics)",
 })
+_ADAPTER = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.5, status_forcelist=(500, 502, 503, 504)),
+)
+SESSION.mount("https://", _ADAPTER)
+SESSION.mount("http://", _ADAPTER)
 
 # Sénat group name → sigle mapping
 SENAT_GROUP_SIGLE = {
@@ -71,23 +89,40 @@ SENAT_GROUP_NAME = {
     "NI": "Non-inscrits",
 }
 
+# Sénat raw group name → (sigle, full name), for the names needing a remap
+_SENAT_RAW_TO_GROUP = {
+    raw: (sigle, SENAT_GROUP_NAME.get(sigle, raw))
+    for raw, sigle in SENAT_GROUP_SIGLE.items()
+}
+
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 def setup_directories():
-    for d in [DATA_DIR, PHOTOS_DIR / "deputes", PHOTOS_DIR / "senateurs"]:
+    for d in [DATA_DIR, AN_OPENDATA_CACHE.parent, PHOTOS_DIR / "deputes", PHOTOS_DIR / "senateurs"]:
         d.mkdir(parents=True, exist_ok=True)
 
 
+# Accented Latin characters (and stray combining marks) → ASCII, built once.
+# Anything outside this range falls back to the NFD reduction in slugify.
+_SLUG_TRANS = str.maketrans({
+    c: unicodedata.normalize("NFD", c).encode("ascii", "ignore").decode("ascii")
+    for c in map(chr, [*range(0x80, 0x180), *range(0x300, 0x370)])
+})
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+
 def slugify(text):
     """Convert a name to a URL-friendly slug."""
-    text = unicodedata.normalize("NFD", text)
-    text = text.encode("ascii", "ignore").decode("ascii")
-    text = text.lower()
-    text = re.sub(r"[^a-z0-9]+", "-", text)
-    return text.strip("-")
+    if not text.isascii():
+        text = text.translate(_SLUG_TRANS)
+        if not text.isascii():
+            # Outside the table: same NFD/ascii-ignore reduction as the table
+            text = unicodedata.normalize("NFD", text)
+            text = text.encode("ascii", "ignore").decode("ascii")
+    return _SLUG_RE.sub("-", text.lower()).strip("-")
 
 
 def fetch_json(url, label="data"):
@@ -95,8 +130,8 @@ def fetch_json(url, label="data"):
     try:
         resp = SESSION.get(url, timeout=30)
         resp.raise_for_status()
-        return resp.json()
-    except requests.RequestException as exc:
+        return orjson.loads(resp.content)
+    except (requests.RequestException, orjson.JSONDecodeError) as exc:
         print(f"    ✗ Error: {exc}")
         return None
 
@@ -112,97 +147,152 @@ def fetch_html(url, label="page"):
         return None
 
 
-def fetch_zip(url, label="archive"):
-    """Download a zip file and return a ZipFile object, or None on error."""
+def fetch_zip(url, cache_path, label="archive"):
+    """Download a zip file and return a ZipFile object, or None on error.
+
+    The archive is kept at *cache_path* with its ETag alongside; later runs
+    send If-None-Match and reopen the cached copy on a 304.
+    """
     print(f"  → Downloading {label}… {url}")
+    etag_path = cache_path.with_suffix(".etag")
+    headers = {}
+    if cache_path.exists() and etag_path.exists():
+        headers["If-None-Match"] = etag_path.read_text(encoding="utf-8").strip()
+
+    tmp = cache_path.with_suffix(".part")
     try:
-        resp = SESSION.get(url, timeout=60)
-        resp.raise_for_status()
-        return zipfile.ZipFile(io.BytesIO(resp.content))
-    except (requests.RequestException, zipfile.BadZipFile) as exc:
+        with SESSION.get(url, headers=headers, stream=True, timeout=60) as resp:
+            resp.raise_for_status()
+            if resp.status_code == 304:
+                print("    ✓ Not modified, using cached copy")
+                return zipfile.ZipFile(cache_path)
+            with open(tmp, "wb") as f:
+                for chunk in resp.iter_content(chunk_size=1 << 16):
+                    f.write(chunk)
+            etag = resp.headers.get("ETag")
+        tmp.replace(cache_path)
+        if etag:
+            etag_path.write_text(etag, encoding="utf-8")
+        else:
+            etag_path.unlink(missing_ok=True)
+        return zipfile.ZipFile(cache_path)
+    except zipfile.BadZipFile as exc:
         print(f"    ✗ Error: {exc}")
+        # Drop the cache too, so a corrupt archive isn't revalidated forever
+        for path in (tmp, cache_path, etag_path):
+            path.unlink(missing_ok=True)
         return None
+    except (requests.RequestException, OSError) as exc:
+        print(f"    ✗ Error: {exc}")
+        tmp.unlink(missing_ok=True)
+        if not cache_path.exists():
+            return None
+        print("    ↺ Falling back to cached copy")
+        try:
+            return zipfile.ZipFile(cache_path)
+        except zipfile.BadZipFile as exc:
+            print(f"    ✗ Error: {exc}")
+            cache_path.unlink(missing_ok=True)
+            etag_path.unlink(missing_ok=True)
+            return None
 
 
 # ---------------------------------------------------------------------------
 # Deputies (data.assemblee-nationale.fr open data)
 # ---------------------------------------------------------------------------
 
+def _parse_acteur_bytes(raw, organe_map):
+    """Parse one json/acteur/*.json member into a deputy record, or None."""
+    data = orjson.loads(raw)
+    act = data.get("acteur", data)
+
+    # Get PA ID
+    uid_info = act.get("uid", {})
+    pa_id = uid_info.get("#text", "") if isinstance(uid_info, dict) else str(uid_info)
+    if not pa_id:
+        return None
+
+    # Identity
+    ident = act.get("etatCivil", {}).get("ident", {})
+    nom = ident.get("nom", "")
+    prenom = ident.get("prenom", "")
+    nom_complet = f"{prenom} {nom}".strip()
+
+    # Find active 17th legislature group
+    mandats = act.get("mandats", {}).get("mandat", [])
+    if not isinstance(mandats, list):
+        mandats = [mandats]
+
+    groupe_sigle = "NI"
+    groupe_nom = "Non inscrit"
+    for m in mandats:
+        if not isinstance(m, dict):
+            continue
+        if (m.get("typeOrgane") == "GP"
+                and m.get("legislature") == "17"
+                and m.get("dateFin") is None):
+            organe_ref = m.get("organes", {}).get("organeRef", "")
+            if organe_ref in organe_map:
+                groupe_sigle = organe_map[organe_ref]["sigle"]
+                groupe_nom = organe_map[organe_ref]["nom"]
+            break
+
+    # Build slug for filename
+    slug = slugify(nom_complet)
+
+    # Photo URL (numeric part of PA ID)
+    pa_num = pa_id.replace("PA", "")
+
+    return {
+        "id": slug,
+        "nom": nom,
+        "prenom": prenom,
+        "nom_complet": nom_complet,
+        "groupe_sigle": groupe_sigle,
+        "groupe_nom": groupe_nom,
+        "photo_url": AN_PHOTO_URL.format(pa_id=pa_num),
+        "type": "depute",
+        "photo": "",
+    }
+
+
 def parse_deputes_opendata(zf):
     """Parse deputies from the AN open data zip file."""
     if zf is None:
         return []
 
+    # Classify members in one directory scan. Organes must be read first,
+    # but "json/acteur/" sorts before "json/organe/", hence the two lists.
+    organe_infos, acteur_infos = [], []
+    for info in zf.infolist():
+        name = info.filename
+        if not name.endswith(".json"):
+            continue
+        if name.startswith("json/organe/"):
+            organe_infos.append(info)
+        elif name.startswith("json/acteur/"):
+            acteur_infos.append(info)
+
     # 1. Build organe lookup: organe_uid -> {sigle, nom}
     organe_map = {}
-    for name in zf.namelist():
-        if name.startswith("json/organe/") and name.endswith(".json"):
-            data = json.loads(zf.read(name))
-            org = data.get("organe", data)
-            if org.get("codeType") == "GP":
-                uid = org.get("uid", "")
-                organe_map[uid] = {
-                    "sigle": org.get("libelleAbrege", ""),
-                    "nom": org.get("libelle", ""),
-                }
+    for info in organe_infos:
+        with zf.open(info) as fp:
+            data = orjson.loads(fp.read())
+        org = data.get("organe", data)
+        if org.get("codeType") == "GP":
+            uid = org.get("uid", "")
+            organe_map[uid] = {
+                "sigle": org.get("libelleAbrege", ""),
+                "nom": org.get("libelle", ""),
+            }
 
     # 2. Parse each deputy
     result = []
-    for name in zf.namelist():
-        if not (name.startswith("json/acteur/") and name.endswith(".json")):
-            continue
-
-        data = json.loads(zf.read(name))
-        act = data.get("acteur", data)
-
-        # Get PA ID
-        uid_info = act.get("uid", {})
-        pa_id = uid_info.get("#text", "") if isinstance(uid_info, dict) else str(uid_info)
-        if not pa_id:
-            continue
-
-        # Identity
-        ident = act.get("etatCivil", {}).get("ident", {})
-        nom = ident.get("nom", "")
-        prenom = ident.get("prenom", "")
-        nom_complet = f"{prenom} {nom}".strip()
-
-        # Find active 17th legislature group
-        mandats = act.get("mandats", {}).get("mandat", [])
-        if not isinstance(mandats, list):
-            mandats = [mandats]
-
-        groupe_sigle = "NI"
-        groupe_nom = "Non inscrit"
-        for m in mandats:
-            if not isinstance(m, dict):
-                continue
-            if (m.get("typeOrgane") == "GP"
-                    and m.get("legislature") == "17"
-                    and m.get("dateFin") is None):
-                organe_ref = m.get("organes", {}).get("organeRef", "")
-                if organe_ref in organe_map:
-                    groupe_sigle = organe_map[organe_ref]["sigle"]
-                    groupe_nom = organe_map[organe_ref]["nom"]
-                break
-
-        # Build slug for filename
-        slug = slugify(nom_complet)
-
-        # Photo URL (numeric part of PA ID)
-        pa_num = pa_id.replace("PA", "")
-
-        result.append({
-            "id": slug,
-            "nom": nom,
-            "prenom": prenom,
-            "nom_complet": nom_complet,
-            "groupe_sigle": groupe_sigle,
-            "groupe_nom": groupe_nom,
-            "photo_url": AN_PHOTO_URL.format(pa_id=pa_num),
-            "type": "depute",
-            "photo": "",
-        })
+    for info in acteur_infos:
+        with zf.open(info) as fp:
+            dep = _parse_acteur_bytes(fp.read(), organe_map)
+        if dep is not None:
+            result.append(dep)
 
     return result
 
@@ -211,10 +301,14 @@ def parse_deputes_opendata(zf):
 # Senators (senat.fr + data.senat.fr)
 # ---------------------------------------------------------------------------
 
-def _extract_matricule(slug):
-    """Extract the matricule (e.g. '21071f') from a senator slug."""
-    m = re.search(r'(\d+[a-z])$', slug)
-    return m.group(1) if m else ""
+# <a href="/senateur/<slug>.html"> entries on the senator list page
+_SENAT_LINK_XPATH = etree.XPath(
+    '//a[starts-with(@href, "/senateur/")'
+    ' and substring(@href, string-length(@href) - 4) = ".html"]'
+)
+
+# Matricule suffix of a senator slug (e.g. '21071f')
+_MATRICULE_RE = re.compile(r'(\d+[a-z])$')
 
 
 def parse_senateurs(html_list, json_data):
@@ -234,22 +328,24 @@ def parse_senateurs(html_list, json_data):
                 continue
             mat = rec.get("Matricule", "").upper()
             raw_group = rec.get("Groupe_politique", "NI") or "NI"
-            sigle = SENAT_GROUP_SIGLE.get(raw_group, raw_group)
-            nom = SENAT_GROUP_NAME.get(sigle, raw_group)
-            group_by_matricule[mat] = (sigle, nom)
+            group_by_matricule[mat] = (
+                _SENAT_RAW_TO_GROUP.get(raw_group)
+                or (raw_group, SENAT_GROUP_NAME.get(raw_group, raw_group))
+            )
 
     # --- Parse senator links from list page ---
-    pattern = re.compile(
-        r'href="/senateur/([^"]+?)\.html"[^>]*>([^<]+)</[Aa]>',
-        re.IGNORECASE,
-    )
+    doc = lxml_html.fromstring(html_list)
 
     result = []
-    for match in pattern.finditer(html_list):
-        slug = match.group(1).strip()
-        raw_name = match.group(2).strip().replace("\xa0", " ").replace("&nbsp;", " ")
+    for a in _SENAT_LINK_XPATH(doc):
+        slug = a.get("href")[len("/senateur/"):-len(".html")].strip()
+        # split() also folds the non-breaking spaces used in the list
+        raw_name = " ".join(a.text_content().split())
+        if not slug or not raw_name:
+            continue
 
-        matricule = _extract_matricule(slug).upper()
+        m = _MATRICULE_RE.search(slug)
+        matricule = m.group(1).upper() if m else ""
 
         parts = raw_name.split(None, 1)
         if len(parts) == 2:
@@ -282,42 +378,136 @@ def parse_senateurs(html_list, json_data):
 # Photo download
 # ---------------------------------------------------------------------------
 
-def download_photo(url, filepath, retries=2):
-    if filepath.exists() and filepath.stat().st_size > 500:
-        return True
+# Leading bytes of JPEG, PNG, GIF and WebP (RIFF) files
+_IMAGE_MAGIC = (b"\xff\xd8\xff", b"\x89PNG", b"GIF8", b"RIFF")
+
+# Transient photo responses worth another attempt
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def load_etags():
+    try:
+        return orjson.loads(PHOTO_ETAGS_FILE.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+
+
+def save_etags(etags):
+    PHOTO_ETAGS_FILE.write_bytes(
+        orjson.dumps(etags, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    )
+
+
+async def _fetch_one(client, sem, url, fp, etags, head_preflight=False, retries=2):
+    """Download a single photo to *fp*; return True on success.
+
+    If *fp* was fetched before with stored validators, the request is
+    conditional and a 304 counts as success without rewriting the file.
+    Otherwise, with *head_preflight*, a HEAD request weeds out missing URLs
+    before the GET. Timeouts, 429 and 5xx responses are retried with
+    backoff; other failures are final.
+    """
+    rel_path = fp.relative_to(BASE_DIR).as_posix()
+    # Conditional only with validators from a previous fetch: the file mtime
+    # is the checkout time after a clone, not the time the photo was fetched.
+    headers = {}
+    cached = etags.get(url, {})
+    if cached.get("path") == rel_path and fp.exists() and fp.stat().st_size > 500:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
 
     for attempt in range(retries + 1):
-        try:
-            resp = SESSION.get(url, timeout=15)
-            if resp.status_code == 200 and len(resp.content) > 500:
-                ct = resp.headers.get("content-type", "")
-                if "image" in ct or "octet" in ct or resp.content[:3] in (b'\xff\xd8\xff', b'\x89PN'):
-                    filepath.write_bytes(resp.content)
-                    return True
-        except requests.RequestException:
-            pass
+        result = await _fetch_attempt(
+            client, sem, url, fp, rel_path, etags, headers, head_preflight
+        )
+        if result is not None:
+            return result
         if attempt < retries:
-            time.sleep(0.5)
+            await asyncio.sleep(0.5 * 2 ** attempt)
 
     return False
 
 
-def download_photos(politicians, subdir):
+async def _fetch_attempt(client, sem, url, fp, rel_path, etags, headers, head_preflight):
+    """One download attempt for _fetch_one: True/False, or None to retry."""
+    # Streamed to a unique .part file and renamed into place, so an
+    # interrupted download never leaves a truncated photo behind and
+    # homonyms sharing an id don't write into each other's temp file.
+    tmp = None
+    size = 0
+    try:
+        async with sem:
+            if head_preflight and not headers:
+                head = await client.head(url)
+                if head.status_code in _RETRY_STATUSES:
+                    return None
+                if head.status_code != 200:
+                    return False
+            async with client.stream("GET", url, headers=headers) as resp:
+                if resp.status_code == 304 and headers:
+                    return True
+                if resp.status_code in _RETRY_STATUSES:
+                    return None
+                if resp.status_code != 200:
+                    return False
+                # Skip tiny or malformed-length bodies up front; the streamed
+                # size is still checked below.
+                content_length = resp.headers.get("content-length")
+                if content_length is not None:
+                    if not content_length.isdigit() or int(content_length) <= 500:
+                        return False
+                ct = resp.headers.get("content-type", "").lower()
+                sniffed = ct.startswith("image/") or "octet-stream" in ct
+                # "xb" rather than mkstemp: keeps the umask-default mode, since
+                # the renamed file is served as a static asset
+                part = fp.with_name(f"{fp.stem}.{secrets.token_hex(4)}.part")
+                with open(part, "xb") as f:
+                    tmp = part
+                    async for chunk in resp.aiter_bytes(1 << 16):
+                        if not size and not (sniffed or chunk.startswith(_IMAGE_MAGIC)):
+                            break
+                        await asyncio.to_thread(f.write, chunk)
+                        size += len(chunk)
+                etag = resp.headers.get("ETag")
+                last_modified = resp.headers.get("Last-Modified")
+        if size <= 500:
+            return False
+        tmp.replace(fp)
+        tmp = None
+    except httpx.TimeoutException:
+        return None
+    except (httpx.HTTPError, OSError):
+        return False
+    finally:
+        if tmp is not None:
+            tmp.unlink(missing_ok=True)
+
+    etags[url] = {"etag": etag, "last_modified": last_modified, "path": rel_path}
+    return True
+
+
+async def download_photos_async(politicians, subdir, concurrency=32, head_preflight=False):
     photo_dir = PHOTOS_DIR / subdir
     total = len(politicians)
-    ok, fail = 0, 0
+    done, ok, fail = 0, 0, 0
 
     print(f"\n📸 Downloading {subdir} photos ({total} total)…")
 
-    for i, pol in enumerate(politicians):
+    async def download_photo(client, sem, pol):
+        nonlocal done, ok, fail
         fp = photo_dir / f"{pol['id']}.jpg"
 
-        urls = pol.get("photo_urls") or ([pol["photo_url"]] if pol.get("photo_url") else [])
         downloaded = False
+        urls = pol.get("photo_urls") or ([pol["photo_url"]] if pol.get("photo_url") else [])
         for url in urls:
-            if download_photo(url, fp):
+            if await _fetch_one(client, sem, url, fp, etags, head_preflight):
                 downloaded = True
                 break
+        else:
+            # Keep a previously downloaded photo if the refresh failed
+            downloaded = fp.exists() and fp.stat().st_size > 500
 
         if downloaded:
             pol["photo"] = f"photos/{subdir}/{pol['id']}.jpg"
@@ -326,12 +516,39 @@ def download_photos(politicians, subdir):
             pol["photo"] = ""
             fail += 1
 
-        if (i + 1) % 25 == 0 or i + 1 == total:
-            pct = int((i + 1) / total * 100)
-            print(f"  [{i+1:>4}/{total}] {pct:3d}%  ✓ {ok}  ✗ {fail}")
-
-        if (i + 1) % 10 == 0:
-            time.sleep(0.3)
+        # Single event loop: the counters need no lock.
+        done += 1
+        if done % 25 == 0 or done == total:
+            pct = int(done / total * 100)
+            print(f"  [{done:>4}/{total}] {pct:3d}%  ✓ {ok}  ✗ {fail}")
+
+    # The semaphore bounds in-flight requests, which also replaces the old
+    # fixed sleep-based throttle. Over HTTP/2 they share a few multiplexed
+    # connections per host.
+    sem = asyncio.Semaphore(concurrency)
+    etags = load_etags()
+    transport = httpx.AsyncHTTPTransport(
+        http2=True,
+        retries=2,
+        limits=httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency),
+    )
+    async with httpx.AsyncClient(
+        transport=transport,
+        headers=dict(SESSION.headers),
+        timeout=15,
+        follow_redirects=True,  # as requests did; applies to the HEAD preflight too
+    ) as client:
+        results = await asyncio.gather(
+            *(download_photo(client, sem, pol) for pol in politicians),
+            return_exceptions=True,
+        )
+    save_etags(etags)
+
+    for pol, res in zip(politicians, results):
+        if isinstance(res, Exception):
+            print(f"  ✗ {pol['id']}: {res!r}")
+            pol["photo"] = ""
+            fail += 1
 
     print(f"  Done: {ok} downloaded, {fail} failed")
     return [p for p in politicians if p["photo"]]
@@ -343,20 +560,20 @@ def download_photos(politicians, subdir):
 
 def save_json(politicians, filename):
     fp = DATA_DIR / filename
-    skip_keys = {"photo_url", "photo_urls"}
-    clean = [{k: v for k, v in p.items() if k not in skip_keys} for p in politicians]
-    fp.write_text(json.dumps(clean, ensure_ascii=False, indent=2), encoding="utf-8")
-    print(f"💾 Saved {len(clean)} entries → {fp}")
+    # Scrape-only keys are dropped in place: the records aren't reused after saving
+    for p in politicians:
+        p.pop("photo_url", None)
+        p.pop("photo_urls", None)
+    with open(fp, "wb", buffering=1 << 20) as f:
+        f.write(orjson.dumps(politicians, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+    print(f"💾 Saved {len(politicians)} entries → {fp}")
 
 
 def print_stats(politicians, label):
-    groups = {}
-    for p in politicians:
-        g = p.get("groupe_sigle", "?")
-        groups[g] = groups.get(g, 0) + 1
+    groups = Counter(p.get("groupe_sigle", "?") for p in politicians)
 
     print(f"\n📊 {label} groups:")
-    for g, c in sorted(groups.items(), key=lambda x: -x[1]):
+    for g, c in groups.most_common():
         print(f"  {g:14s} {c:>4}")
 
 
@@ -365,6 +582,13 @@ def print_stats(politicians, label):
 # ---------------------------------------------------------------------------
 
 def main():
+    parser = argparse.ArgumentParser(description="Polidle data scraper")
+    parser.add_argument(
+        "--head-preflight", action="store_true",
+        help="send a HEAD before downloading new photos, to skip missing ones cheaply",
+    )
+    args = parser.parse_args()
+
     print("=" * 55)
     print("  POLIDLE — Data Scraper")
     print("=" * 55)
@@ -373,7 +597,7 @@ def main():
 
     # ── Deputies (AN open data) ───────────────────────────────
     print("\n🟦 ASSEMBLÉE NATIONALE (17e législature)")
-    zf = fetch_zip(AN_OPENDATA_ZIP, "open data archive")
+    zf = fetch_zip(AN_OPENDATA_ZIP, AN_OPENDATA_CACHE, "open data archive")
     deputes = parse_deputes_opendata(zf) if zf else []
     print(f"  Parsed {len(deputes)} deputies")
 
@@ -390,9 +614,11 @@ def main():
 
     # ── Download photos ───────────────────────────────────────
     if deputes:
-        deputes = download_photos(deputes, "deputes")
+        deputes = asyncio.run(download_photos_async(
+            deputes, "deputes", head_preflight=args.head_preflight))
     if senateurs:
-        senateurs = download_photos(senateurs, "senateurs")
+        senateurs = asyncio.run(download_photos_async(
+            senateurs, "senateurs", head_preflight=args.head_preflight))
 
     # ── Save ──────────────────────────────────────────────────
     if deputes: